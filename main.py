@@ -18,9 +18,11 @@ Requirements:
 import sys
 from pathlib import Path
 
-# Add src directory to Python path for imports
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+# Add src directory to Python path for imports (guarded so repeated entry
+# points don't stack duplicate entries that every import would then scan)
+src_path = str(Path(__file__).parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 
 def main() -> None:
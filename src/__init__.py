@@ -4,9 +4,6 @@ Card Game Generator - Source Package
 This package contains the core modules for generating custom trading card games.
 """
 
-from .card_generator import Card, generate_card_data, generate_card_image, create_card_game_zip
-from .html_card_generator import create_html_card, get_available_templates
-
 __version__ = "1.0.0"
 __author__ = "Card Game Generator Team"
 
@@ -17,4 +14,31 @@ __all__ = [
     "create_card_game_zip",
     "create_html_card",
     "get_available_templates",
+    "render_cards_batch",
+    "render_many",
 ]
+
+# Map each public name to the submodule that provides it so attribute access
+# only imports what the caller actually uses (PEP 562 lazy re-exports).
+_lazy_imports = {
+    "Card": "card_generator",
+    "generate_card_data": "card_generator",
+    "generate_card_image": "card_generator",
+    "create_card_game_zip": "card_generator",
+    "create_html_card": "html_card_generator",
+    "get_available_templates": "html_card_generator",
+    "render_cards_batch": "html_card_generator",
+    "render_many": "html_card_generator",
+}
+
+
+def __getattr__(name: str):
+    """Resolve public names lazily on first access."""
+    if name in _lazy_imports:
+        from importlib import import_module
+
+        module = import_module(f".{_lazy_imports[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,13 +8,25 @@ and card artwork using image generation APIs.
 
 import json
 import os
-import zipfile
-from dataclasses import dataclass, field, asdict
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Callable, Optional
+from urllib.parse import quote as _quote
 
-import requests
+# Heavy dependencies (requests, zipfile, html_card_generator) are imported
+# lazily inside the functions that need them, so importing this module for
+# the Card dataclass or constants stays cheap.
 
-from html_card_generator import create_html_card, get_available_templates
+# Optional fast JSON backend; stdlib json is the zero-dependency fallback.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 
 # =============================================================================
@@ -26,18 +38,90 @@ IMAGE_API_URL = "https://image.pollinations.ai/prompt"
 IMAGE_WIDTH = 512
 IMAGE_HEIGHT = 512
 IMAGE_MODEL = "flux"
-
-# Card type mappings based on theme
-THEME_CARD_TYPES: dict[str, list[str]] = {
-    "fantasy": ["creature", "spell", "artifact", "enchantment", "hero"],
-    "medieval": ["creature", "spell", "artifact", "enchantment", "hero"],
-    "magic": ["creature", "spell", "artifact", "enchantment", "hero"],
-    "sci-fi": ["robot", "tech", "weapon", "vehicle", "alien"],
-    "science fiction": ["robot", "tech", "weapon", "vehicle", "alien"],
-    "futuristic": ["robot", "tech", "weapon", "vehicle", "alien"],
-    "space": ["robot", "tech", "weapon", "vehicle", "alien"],
+MAX_WORKERS = 8
+
+# Fixed query string for image requests; only the prompt varies per call.
+_IMAGE_QS = f"?width={IMAGE_WIDTH}&height={IMAGE_HEIGHT}&model={IMAGE_MODEL}"
+
+# Resolved once; _get_fallback_image_path used to re-join these per call.
+_ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+_FALLBACK_IMAGE = str(_ASSETS_DIR / "card_template.jpg")
+
+# Card type mappings based on theme (tuples: immutable, shared safely)
+THEME_CARD_TYPES: dict[str, tuple[str, ...]] = {
+    "fantasy": ("creature", "spell", "artifact", "enchantment", "hero"),
+    "medieval": ("creature", "spell", "artifact", "enchantment", "hero"),
+    "magic": ("creature", "spell", "artifact", "enchantment", "hero"),
+    "sci-fi": ("robot", "tech", "weapon", "vehicle", "alien"),
+    "science fiction": ("robot", "tech", "weapon", "vehicle", "alien"),
+    "futuristic": ("robot", "tech", "weapon", "vehicle", "alien"),
+    "space": ("robot", "tech", "weapon", "vehicle", "alien"),
 }
-DEFAULT_CARD_TYPES = ["character", "action", "item", "location", "event"]
+DEFAULT_CARD_TYPES: tuple[str, ...] = ("character", "action", "item", "location", "event")
+
+# The card JSON schema and surrounding prompt text are constant; only the
+# theme and card type vary per call, so the prompt is assembled once here.
+_JSON_SCHEMA_STR = json.dumps({
+    "name": "string",
+    "description": "string",
+    "image_prompt": "string",
+    "stats": {"stat_name": "integer"},
+    "card_type": "string"
+})
+_PROMPT_TEMPLATE = (
+    "You are a creative assistant for a trading card game designer. "
+    "Your task is to generate a unique card concept based on the theme: '{theme}' "
+    "and card type: '{card_type}'. For the card, you must provide a name, "
+    "a short description (max 100 characters), an image prompt for AI image generation, "
+    "and relevant stats. The stats should be balanced for a trading card game. "
+    "Also include the card_type. IMPORTANT: Your entire response MUST be a single, "
+    "valid JSON object. Do not include any text, explanation, or markdown formatting "
+    "before or after the JSON object. The JSON schema for the card object must be "
+    # Brace-escaped so the schema survives str.format untouched.
+    "as follows: " + _JSON_SCHEMA_STR.replace("{", "{{").replace("}", "}}") + "."
+)
+
+
+# =============================================================================
+# HTTP Session
+# =============================================================================
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session():
+    """
+    Return the shared pooled HTTP session, creating it on first use.
+
+    The session reuses keep-alive connections to pollinations.ai so
+    concurrent card generation avoids a TCP+TLS handshake per request.
+    Created lazily so importing this module doesn't pull in requests.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                session.headers.update({"Content-Type": "application/json"})
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=16,
+                        pool_maxsize=16,
+                        max_retries=Retry(
+                            total=3,
+                            backoff_factor=0.3,
+                            status_forcelist=[502, 503, 504]
+                        )
+                    )
+                )
+                _SESSION = session
+    return _SESSION
 
 
 # =============================================================================
@@ -55,8 +139,67 @@ class Card:
     card_type: str
     
     def to_dict(self) -> dict[str, Any]:
-        """Convert the card to a dictionary format."""
-        return asdict(self)
+        """
+        Convert the card to a dictionary format.
+
+        Built explicitly rather than via dataclasses.asdict, which deep-copies
+        every field; only the stats dict needs a (shallow) copy to keep the
+        result detached from the card.
+        """
+        return {
+            "name": self.name,
+            "description": self.description,
+            "image_prompt": self.image_prompt,
+            "stats": dict(self.stats),
+            "card_type": self.card_type,
+        }
+
+
+# =============================================================================
+# JSON Helpers
+# =============================================================================
+
+def _json_loads(data: str) -> Any:
+    """Parse JSON with orjson when available, stdlib json otherwise."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_indented(obj: Any) -> str:
+    """Serialize to indented JSON with orjson when available."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=4)
+
+
+def _post_text_api(payload: dict[str, Any]) -> Any:
+    """
+    POST the payload to the text API and return the parsed JSON response.
+
+    Uses the pooled requests session when requests is installed. Deployments
+    that treat requests as optional (single-shot CLI runs) fall back to
+    stdlib urllib, which handles a one-off JSON POST just fine and keeps
+    startup free of the requests import. Transport failures from either
+    backend surface as OSError subclasses.
+    """
+    try:
+        import requests  # noqa: F401 -- probe for the optional dependency
+    except ImportError:
+        import urllib.request
+
+        request = urllib.request.Request(
+            TEXT_API_URL,
+            data=json.dumps(payload).encode('utf-8'),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return _json_loads(response.read().decode('utf-8'))
+
+    response = _get_session().post(url=TEXT_API_URL, json=payload, timeout=60)
+    response.raise_for_status()
+    return response.json()
 
 
 # =============================================================================
@@ -74,43 +217,17 @@ def generate_card_data(theme: str, card_type: str) -> Optional[Card]:
     Returns:
         A Card object with generated data, or None if generation fails.
     """
-    json_schema = {
-        "name": "string",
-        "description": "string",
-        "image_prompt": "string",
-        "stats": {"stat_name": "integer"},
-        "card_type": "string"
-    }
-    
-    llm_prompt = (
-        f"You are a creative assistant for a trading card game designer. "
-        f"Your task is to generate a unique card concept based on the theme: '{theme}' "
-        f"and card type: '{card_type}'. For the card, you must provide a name, "
-        f"a short description (max 100 characters), an image prompt for AI image generation, "
-        f"and relevant stats. The stats should be balanced for a trading card game. "
-        f"Also include the card_type. IMPORTANT: Your entire response MUST be a single, "
-        f"valid JSON object. Do not include any text, explanation, or markdown formatting "
-        f"before or after the JSON object. The JSON schema for the card object must be "
-        f"as follows: {json.dumps(json_schema)}."
-    )
-    
+    llm_prompt = _PROMPT_TEMPLATE.format(theme=theme, card_type=card_type)
+
     payload = {
         "model": "openai",
         "messages": [{"role": "user", "content": llm_prompt}]
     }
     
     try:
-        response = requests.post(
-            url=TEXT_API_URL,
-            headers={"Content-Type": "application/json"},
-            json=payload,
-            timeout=60
-        )
-        response.raise_for_status()
-        
-        response_json = response.json()
-        card_data = json.loads(response_json["choices"][0]["message"]["content"])
-        
+        response_json = _post_text_api(payload)
+        card_data = _json_loads(response_json["choices"][0]["message"]["content"])
+
         return Card(
             name=card_data["name"],
             description=card_data["description"],
@@ -118,16 +235,17 @@ def generate_card_data(theme: str, card_type: str) -> Optional[Card]:
             stats=card_data["stats"],
             card_type=card_data["card_type"]
         )
-        
-    except requests.exceptions.RequestException as e:
-        print(f"Error making API call to Pollinations.ai: {e}")
-        return None
+
     except json.JSONDecodeError as e:
         print(f"Error decoding JSON from API response: {e}")
         return None
     except KeyError as e:
         print(f"Missing key in API response: {e}")
         return None
+    # Both requests exceptions and urllib's URLError are OSError subclasses.
+    except OSError as e:
+        print(f"Error making API call to Pollinations.ai: {e}")
+        return None
 
 
 def generate_card_image(image_prompt: str, output_path: str) -> bool:
@@ -136,25 +254,27 @@ def generate_card_image(image_prompt: str, output_path: str) -> bool:
     
     Args:
         image_prompt: The prompt describing the image to generate
-        output_path: The file path where the image should be saved
-    
+        output_path: The file path where the image should be saved.
+            The parent directory must already exist; create_card_game_zip
+            sets up the card directories once before generating.
+
     Returns:
         True if the image was generated successfully, False otherwise.
     """
+    import requests
+
     try:
-        encoded_prompt = requests.utils.quote(image_prompt)
-        image_url = (
-            f"{IMAGE_API_URL}/{encoded_prompt}"
-            f"?width={IMAGE_WIDTH}&height={IMAGE_HEIGHT}&model={IMAGE_MODEL}"
-        )
-        
-        response = requests.get(image_url, timeout=120)
-        response.raise_for_status()
-        
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
-        
+        image_url = f"{IMAGE_API_URL}/{_quote(image_prompt, safe='')}{_IMAGE_QS}"
+
+        with _get_session().get(image_url, timeout=120, stream=True) as response:
+            response.raise_for_status()
+            with open(output_path, 'wb') as f:
+                # iter_content (unlike response.raw) applies any
+                # Content-Encoding the server used, so a gzip-compressed
+                # response still lands on disk as a valid PNG
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+
         return True
         
     except requests.exceptions.RequestException as e:
@@ -165,10 +285,23 @@ def generate_card_image(image_prompt: str, output_path: str) -> bool:
         return False
 
 
-def _get_card_types_for_theme(theme: str) -> list[str]:
-    """Get the appropriate card types for a given theme."""
-    theme_lower = theme.lower()
-    return THEME_CARD_TYPES.get(theme_lower, DEFAULT_CARD_TYPES)
+@lru_cache(maxsize=1)
+def _cached_templates() -> dict[str, dict[str, Any]]:
+    """
+    Discover available templates once per process.
+
+    Template discovery scans the assets directory; the result never changes
+    while the application is running, so it is cached here at the call site.
+    """
+    from html_card_generator import get_available_templates
+
+    return get_available_templates()
+
+
+@lru_cache(maxsize=32)
+def _get_card_types_for_theme(theme: str) -> tuple[str, ...]:
+    """Get the appropriate card types for a given theme (memoized per theme)."""
+    return THEME_CARD_TYPES.get(theme.lower(), DEFAULT_CARD_TYPES)
 
 
 def _create_fallback_card(theme: str, card_type: str, index: int) -> Card:
@@ -184,7 +317,7 @@ def _create_fallback_card(theme: str, card_type: str, index: int) -> Card:
 
 def _get_fallback_image_path() -> str:
     """Get the path to the fallback placeholder image."""
-    return os.path.join(os.path.dirname(__file__), "..", "assets", "card_template.jpg")
+    return _FALLBACK_IMAGE
 
 
 def _generate_game_rules(
@@ -193,9 +326,9 @@ def _generate_game_rules(
     generated_cards: list[Card]
 ) -> str:
     """Generate the game rules text file content."""
-    card_types = set(card.card_type for card in generated_cards)
-    
-    rules = f"""Card Game: {theme.title()}
+    card_types = {card.card_type for card in generated_cards}
+
+    parts = [f"""Card Game: {theme.title()}
 {'=' * 50}
 
 Template Style: {template_name}
@@ -208,12 +341,12 @@ BASIC RULES:
 - First player to reduce opponent's health to 0 wins!
 
 CARD TYPES:
-"""
+"""]
     for card_type in card_types:
-        rules += f"- {card_type.title()}: Special abilities and effects\n"
-    
-    rules += f"\nGenerated {len(generated_cards)} unique cards for your {theme} themed game!\n"
-    return rules
+        parts.append(f"- {card_type.title()}: Special abilities and effects\n")
+
+    parts.append(f"\nGenerated {len(generated_cards)} unique cards for your {theme} themed game!\n")
+    return "".join(parts)
 
 
 def _generate_readme(
@@ -222,7 +355,7 @@ def _generate_readme(
     generated_cards: list[Card]
 ) -> str:
     """Generate the README content for the card game."""
-    content = f"""# {theme.title()} Card Game
+    parts = [f"""# {theme.title()} Card Game
 
 This card game was generated using the Card Game Generator.
 
@@ -233,11 +366,11 @@ This card game was generated using the Card Game Generator.
 - `game_info/`: Contains game rules and documentation
 
 ## Cards Generated
-"""
+"""]
     for i, card in enumerate(generated_cards):
-        content += f"{i + 1}. **{card.name}** ({card.card_type}): {card.description}\n"
-    
-    return content
+        parts.append(f"{i + 1}. **{card.name}** ({card.card_type}): {card.description}\n")
+
+    return "".join(parts)
 
 
 # =============================================================================
@@ -247,37 +380,202 @@ This card game was generated using the Card Game Generator.
 ProgressCallback = Callable[[str, int, int], None]
 
 
+class GenerationCancelled(Exception):
+    """Raised inside a card worker when the caller requests cancellation."""
+
+
+class _ProgressCounter:
+    """
+    Thread-safe step counter that forwards progress updates to a callback.
+
+    With several workers reporting concurrently, unthrottled callbacks flood
+    UI callers with redraws, so intermediate updates are rate-limited; the
+    terminal update (via finish) is always delivered.
+    """
+
+    #: Minimum seconds between intermediate callback emissions.
+    MIN_EMIT_INTERVAL = 0.05
+
+    def __init__(self, callback: Optional[ProgressCallback], total_steps: int) -> None:
+        self.callback = callback
+        self.total_steps = total_steps
+        self.current_step = 0
+        self._lock = threading.Lock()
+        self._last_emit = 0.0
+
+    def announce(self, message: str) -> None:
+        """Report the current step without advancing the counter."""
+        with self._lock:
+            if self.callback is None:
+                return
+            now = time.monotonic()
+            if now - self._last_emit >= self.MIN_EMIT_INTERVAL:
+                self._last_emit = now
+                self.callback(message, self.current_step, self.total_steps)
+
+    def advance(self) -> None:
+        """Mark one step as completed."""
+        with self._lock:
+            self.current_step += 1
+
+    def finish(self, message: str) -> None:
+        """Deliver the terminal update; never rate-limited."""
+        with self._lock:
+            if self.callback:
+                self.callback(message, self.total_steps, self.total_steps)
+
+
+class _ImageCache:
+    """
+    Deduplicates artwork downloads for identical prompts within a batch.
+
+    The LLM (and especially the fallback card data) can produce the same
+    image prompt for several cards; the first worker to see a prompt does
+    the download while concurrent workers with the same prompt wait on an
+    event and then copy the finished file instead of re-fetching it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._events: dict[str, threading.Event] = {}
+        self._paths: dict[str, Path] = {}
+
+    def fetch(self, prompt: str, dest: Path) -> bool:
+        """Materialize the artwork for prompt at dest; True on success."""
+        with self._lock:
+            event = self._events.get(prompt)
+            is_owner = event is None
+            if is_owner:
+                event = self._events[prompt] = threading.Event()
+
+        if is_owner:
+            try:
+                success = generate_card_image(prompt, str(dest))
+                with self._lock:
+                    if success:
+                        self._paths[prompt] = dest
+            finally:
+                # Always release the waiters, even if the download raised;
+                # otherwise every thread sharing this prompt blocks forever
+                event.set()
+            return success
+
+        event.wait()
+        with self._lock:
+            source = self._paths.get(prompt)
+        if source is None:
+            # The owning download failed; try once more independently.
+            return generate_card_image(prompt, str(dest))
+        shutil.copyfile(source, dest)
+        return True
+
+
+def _build_one_card(
+    index: int,
+    num_cards: int,
+    card_type: str,
+    theme: str,
+    cards_dir: Path,
+    progress: _ProgressCounter,
+    image_cache: _ImageCache,
+    cancel_event: Optional[threading.Event] = None
+) -> tuple[Card, tuple[str, str], list[tuple[str, Path]], tuple[str, str, Path]]:
+    """
+    Generate a single card's data and artwork.
+
+    Writes the card's JSON and raw art into cards_dir. Returns the Card,
+    its serialized JSON, the (arcname, path) pairs of the image files
+    produced, and the pending render (art_path, arcname, output path) for
+    the playable card image — rendering is deferred so the caller can
+    batch every card into one wkhtmltoimage invocation. Designed to run
+    concurrently from a thread pool, so all shared state goes through the
+    thread-safe progress counter.
+
+    Raises GenerationCancelled between steps once cancel_event is set.
+    """
+    def check_cancelled() -> None:
+        if cancel_event is not None and cancel_event.is_set():
+            raise GenerationCancelled()
+
+    # Step 1: Generate card data
+    check_cancelled()
+    progress.announce(f"Generating card data {index + 1}/{num_cards}: {card_type}")
+
+    card = generate_card_data(theme, card_type)
+    if card is None:
+        print(f"Falling back to generic card data for {card_type}")
+        card = _create_fallback_card(theme, card_type, index)
+
+    progress.advance()
+
+    # Save card data as JSON
+    card_filename_base = f"{card.name.replace(' ', '_').lower()}_{index}"
+    card_json = _json_dumps_indented(card.to_dict())
+    (cards_dir / f"{card_filename_base}.json").write_text(card_json, encoding='utf-8')
+
+    image_files: list[tuple[str, Path]] = []
+
+    # Step 2: Generate card artwork
+    check_cancelled()
+    progress.announce(f"Generating artwork for {card.name}")
+
+    raw_image_path = cards_dir / f"raw_{card_filename_base}.png"
+    if image_cache.fetch(card.image_prompt, raw_image_path):
+        image_files.append((f"cards/raw_{card_filename_base}.png", raw_image_path))
+        art_path = str(raw_image_path)
+    else:
+        print(f"Using placeholder image for {card.name}")
+        art_path = _get_fallback_image_path()
+
+    progress.advance()
+
+    # Step 3 (the playable render) happens back in create_card_game_zip,
+    # batched across all cards
+    playable_card_path = cards_dir / f"{card_filename_base}.png"
+    pending_render = (art_path, f"cards/{card_filename_base}.png", playable_card_path)
+
+    return card, (f"cards/{card_filename_base}.json", card_json), image_files, pending_render
+
+
 def create_card_game_zip(
     theme: str,
     output_dir: str,
     num_cards: int = 5,
     template_style: str = "bright_swiss",
-    progress_callback: Optional[ProgressCallback] = None
+    progress_callback: Optional[ProgressCallback] = None,
+    cancel_event: Optional[threading.Event] = None
 ) -> str:
     """
     Create a complete card game as a zip file.
-    
+
     Args:
         theme: The theme for the card game (e.g., "Fantasy", "Cyberpunk")
         output_dir: Directory where the zip file should be created
         num_cards: Number of cards to generate (1-20)
         template_style: The card template style to use
         progress_callback: Optional callback for progress updates
-    
+        cancel_event: Optional event; once set, pending cards are abandoned
+            and the zip is finished with the cards completed so far
+
     Returns:
         The path to the created zip file.
-    
+
     Raises:
         ValueError: If template_style is not recognized
     """
-    # Set up directories
+    import zipfile
+
+    from html_card_generator import render_many
+
+    # Set up directories (kept as Path objects; converted to str only at
+    # the boundaries that need it)
     safe_theme = theme.replace(' ', '_').lower()
-    project_dir = os.path.join(output_dir, f"{safe_theme}_card_game")
-    cards_dir = os.path.join(project_dir, "cards")
-    game_info_dir = os.path.join(project_dir, "game_info")
+    project_dir = Path(output_dir) / f"{safe_theme}_card_game"
+    cards_dir = project_dir / "cards"
+    game_info_dir = project_dir / "game_info"
     
     # Validate and get template
-    templates = get_available_templates()
+    templates = _cached_templates()
     if template_style not in templates:
         available = list(templates.keys())
         print(f"Template '{template_style}' not found. Available: {available}")
@@ -287,80 +585,97 @@ def create_card_game_zip(
     template_name = templates[template_style]["name"]
     
     # Create directories
-    os.makedirs(cards_dir, exist_ok=True)
-    os.makedirs(game_info_dir, exist_ok=True)
+    cards_dir.mkdir(parents=True, exist_ok=True)
+    game_info_dir.mkdir(parents=True, exist_ok=True)
     
     # Get card types for theme
     card_types = _get_card_types_for_theme(theme)
     
     # Progress tracking
     total_steps = num_cards * 3  # data + image + card creation per card
-    current_step = 0
-    generated_cards: list[Card] = []
-    
-    # Generate each card
-    for i in range(num_cards):
-        card_type = card_types[i % len(card_types)]
-        
-        # Step 1: Generate card data
-        if progress_callback:
-            progress_callback(f"Generating card data {i + 1}/{num_cards}: {card_type}", current_step, total_steps)
-        
-        card = generate_card_data(theme, card_type)
-        if card is None:
-            print(f"Falling back to generic card data for {card_type}")
-            card = _create_fallback_card(theme, card_type, i)
-        
-        generated_cards.append(card)
-        current_step += 1
-        
-        # Save card data as JSON
-        card_filename_base = f"{card.name.replace(' ', '_').lower()}_{i}"
-        json_path = os.path.join(cards_dir, f"{card_filename_base}.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(card.to_dict(), f, indent=4)
-        
-        # Step 2: Generate card artwork
-        if progress_callback:
-            progress_callback(f"Generating artwork for {card.name}", current_step, total_steps)
-        
-        raw_image_path = os.path.join(cards_dir, f"raw_{card_filename_base}.png")
-        if not generate_card_image(card.image_prompt, raw_image_path):
-            print(f"Using placeholder image for {card.name}")
-            raw_image_path = _get_fallback_image_path()
-        
-        current_step += 1
-        
-        # Step 3: Create playable card image
-        if progress_callback:
-            progress_callback(f"Creating playable card for {card.name}", current_step, total_steps)
-        
-        playable_card_path = os.path.join(cards_dir, f"{card_filename_base}.png")
-        create_html_card(card, raw_image_path, template_path, playable_card_path, i + 1)
-        current_step += 1
-    
-    # Create game rules
-    rules_path = os.path.join(game_info_dir, "game_rules.txt")
-    with open(rules_path, 'w', encoding='utf-8') as f:
-        f.write(_generate_game_rules(theme, template_name, generated_cards))
-    
-    # Create README
-    readme_path = os.path.join(project_dir, "README.md")
-    with open(readme_path, 'w', encoding='utf-8') as f:
-        f.write(_generate_readme(theme, template_name, generated_cards))
-    
-    # Create zip file
+    progress = _ProgressCounter(progress_callback, total_steps)
+
+    # Generate cards concurrently (each card is independent and the work is
+    # dominated by waiting on the pollinations.ai APIs) and stream results
+    # into the zip as they complete, instead of walking the project dir and
+    # re-reading every file afterwards. Only this thread touches the zip.
+    # PNG payloads are already compressed, so only text gets DEFLATE.
+    card_slots: list[Optional[Card]] = [None] * num_cards
+    render_slots: list[Optional[tuple[str, str, Path]]] = [None] * num_cards
+    image_cache = _ImageCache()
     zip_path = f"{project_dir}.zip"
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, _, files in os.walk(project_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, project_dir)
-                zipf.write(file_path, arcname)
-    
-    if progress_callback:
-        progress_callback("Card game generated successfully!", total_steps, total_steps)
+    # Workers cover the network waits (the GIL is released there); the
+    # render phase runs afterwards as one batched pass over all cards.
+    max_workers = min(num_cards, max(MAX_WORKERS, os.cpu_count() or 1))
+    with zipfile.ZipFile(zip_path, 'w') as zipf, \
+            ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_index = {
+            executor.submit(
+                _build_one_card,
+                i,
+                num_cards,
+                card_types[i % len(card_types)],
+                theme,
+                cards_dir,
+                progress,
+                image_cache,
+                cancel_event
+            ): i
+            for i in range(num_cards)
+        }
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                card, (json_arcname, card_json), image_files, pending_render = future.result()
+            except GenerationCancelled:
+                continue
+            card_slots[index] = card
+            render_slots[index] = pending_render
+            zipf.writestr(json_arcname, card_json, compress_type=zipfile.ZIP_DEFLATED)
+            for arcname, file_path in image_files:
+                zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+
+        generated_cards = [card for card in card_slots if card is not None]
+
+        # Render every playable card in one batched pass — one renderer
+        # startup per worker instead of one per card. Skipped entirely on
+        # cancellation; the kept cards still have their data and raw art.
+        if not (cancel_event is not None and cancel_event.is_set()):
+            jobs = []
+            entries = []
+            for index, pending_render in enumerate(render_slots):
+                if card_slots[index] is None or pending_render is None:
+                    continue
+                art_path, arcname, playable_path = pending_render
+                jobs.append((
+                    card_slots[index], art_path, template_path,
+                    str(playable_path), index + 1
+                ))
+                entries.append((card_slots[index], arcname, playable_path))
+            if jobs:
+                progress.announce(f"Creating {len(jobs)} playable card images")
+                for (card, arcname, playable_path), success in zip(entries, render_many(jobs)):
+                    if success:
+                        zipf.write(playable_path, arcname, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        print(f"Skipping playable card image for {card.name} (render failed)")
+                    progress.advance()
+
+        # Create game rules
+        rules_text = _generate_game_rules(theme, template_name, generated_cards)
+        (game_info_dir / "game_rules.txt").write_text(rules_text, encoding='utf-8')
+        zipf.writestr("game_info/game_rules.txt", rules_text, compress_type=zipfile.ZIP_DEFLATED)
+
+        # Create README
+        readme_text = _generate_readme(theme, template_name, generated_cards)
+        (project_dir / "README.md").write_text(readme_text, encoding='utf-8')
+        zipf.writestr("README.md", readme_text, compress_type=zipfile.ZIP_DEFLATED)
     
+    if cancel_event is not None and cancel_event.is_set():
+        progress.finish(f"Generation cancelled; kept {len(generated_cards)} finished cards.")
+    else:
+        progress.finish("Card game generated successfully!")
+
     return zip_path
 
 
@@ -370,7 +685,7 @@ def create_card_game_zip(
 
 if __name__ == "__main__":
     import sys
-    
+
     if len(sys.argv) > 1:
         theme_arg = sys.argv[1]
         num_cards_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 5
@@ -384,4 +699,4 @@ if __name__ == "__main__":
         print(f"Successfully created: {result}")
     else:
         print("Usage: python card_generator.py <theme> [num_cards] [template_style]")
-        print(f"Available templates: {list(get_available_templates().keys())}")
+        print(f"Available templates: {list(_cached_templates().keys())}")
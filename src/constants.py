@@ -0,0 +1,22 @@
+"""
+Card Game Generator - GUI Constants
+
+Shared user-interface constants: window geometry, fonts, card-count limits,
+and the example themes shown in the GUI.
+"""
+
+WINDOW_TITLE = "Card Game Generator"
+WINDOW_SIZE = "650x550"
+FONT_TITLE = ('Arial', 18, 'bold')
+FONT_LABEL = ('Arial', 12)
+FONT_ENTRY = ('Arial', 12)
+FONT_LOG = ('Consolas', 9)
+
+MIN_CARDS = 1
+MAX_CARDS = 20
+DEFAULT_CARDS = 5
+
+EXAMPLE_THEMES = [
+    "Fantasy", "Sci-Fi", "Medieval", "Cyberpunk",
+    "Steampunk", "Horror", "Space", "Pirates"
+]
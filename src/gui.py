@@ -5,35 +5,85 @@ This module provides a graphical user interface for the Card Game Generator
 application using Tkinter.
 """
 
+import collections
 import os
+import queue
 import threading
+import time
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
+import types
+from functools import partial
+from pathlib import Path
+from tkinter import filedialog, font as tkfont, messagebox, ttk
 from typing import Optional
 
-from card_generator import create_card_game_zip
-from html_card_generator import get_available_templates
+from constants import (
+    DEFAULT_CARDS,
+    EXAMPLE_THEMES,
+    FONT_LOG,
+    FONT_TITLE,
+    MAX_CARDS,
+    MIN_CARDS,
+    WINDOW_SIZE,
+    WINDOW_TITLE,
+)
+
+# card_generator and html_card_generator are imported lazily (template
+# discovery on first load, the generator inside the worker thread) so the
+# window can be drawn before their import cost is paid.
 
 
 # =============================================================================
 # Constants
 # =============================================================================
 
-WINDOW_TITLE = "Card Game Generator"
-WINDOW_SIZE = "650x550"
-FONT_TITLE = ('Arial', 18, 'bold')
-FONT_LABEL = ('Arial', 12)
-FONT_ENTRY = ('Arial', 12)
-FONT_LOG = ('Consolas', 9)
+# Templates the GUI exposes (discovery may find more)
+ALLOWED_TEMPLATES = frozenset({"bright_swiss", "detailed"})
+
+# Static per-template feature blurbs shown by the Info button; built once
+# and wrapped in a read-only proxy
+_TEMPLATE_FEATURES = types.MappingProxyType({
+    "bright_swiss": (
+        "• Bright yellow and blue color scheme\n"
+        "• Bold, modern typography\n"
+        "• Distinct header and footer sections\n"
+        "• Image with luminosity blend mode"
+    ),
+    "detailed": (
+        "• Ornate, detailed frame design\n"
+        "• Textured background elements\n"
+        "• Prominent name bar\n"
+        "• Integrated stats and description area"
+    ),
+})
+
+# Interval (ms) between batched log/progress flushes to the Tk widgets
+UI_FLUSH_INTERVAL_MS = 50
+
+# Interval (ms) at which the main thread drains worker->UI messages
+UI_PUMP_INTERVAL_MS = 30
+
+# Maximum queued messages applied per pump tick
+UI_PUMP_BATCH_SIZE = 200
 
-MIN_CARDS = 1
-MAX_CARDS = 20
-DEFAULT_CARDS = 5
+# Minimum seconds between progress-bar/status redraws (~60 Hz); the
+# terminal update is always applied
+PROGRESS_REDRAW_INTERVAL = 0.016
 
-EXAMPLE_THEMES = [
-    "Fantasy", "Sci-Fi", "Medieval", "Cyberpunk",
-    "Steampunk", "Horror", "Space", "Pirates"
-]
+# Trim the log buffer once it exceeds this many lines, keeping the most
+# recent LOG_KEEP_LINES, so long sessions don't grow Tk's text storage
+# without bound
+LOG_MAX_LINES = 1000
+LOG_KEEP_LINES = 500
+
+# Resolved once at import; every GUI construction reuses them
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_DEFAULT_OUTPUT = str(_PROJECT_ROOT / "output")
+
+# Validation range and error strings, built once instead of per click
+_ALLOWED_CARD_RANGE = range(MIN_CARDS, MAX_CARDS + 1)
+_ERR_NUM_RANGE = f"Number of cards must be between {MIN_CARDS} and {MAX_CARDS}!"
+_ERR_NUM_INVALID = "Please enter a valid number of cards!"
 
 
 # =============================================================================
@@ -65,27 +115,51 @@ class CardGameGeneratorGUI:
         
         # Template data
         self.templates = self._load_templates()
+
+        # Pending log lines, flushed to the Text widget in batches so fast
+        # generators don't force one full Tk redraw per message
+        self._log_queue: collections.deque[str] = collections.deque()
+        self._flush_scheduled = False
+
+        # Worker threads never touch Tk directly (Tcl/Tk is not
+        # thread-safe); they post messages here and the main thread
+        # applies them from a periodic pump
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._last_progress_redraw = 0.0
+
+        # Set by the Cancel button; checked between steps in the generator
+        self._cancel_event = threading.Event()
         
         # Configure style
         style = ttk.Style()
         style.theme_use('clam')
         
         # Set default output directory
-        default_output = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
-        self.output_dir_var.set(default_output)
+        self.output_dir_var.set(_DEFAULT_OUTPUT)
         
         # Build UI
         self._setup_ui()
+
+        # Start draining worker messages
+        self.root.after(UI_PUMP_INTERVAL_MS, self._pump_ui_queue)
     
     def _load_templates(self) -> dict:
         """Load and filter available templates."""
+        from html_card_generator import get_available_templates
+
         all_templates = get_available_templates()
-        # Only include the supported templates
-        allowed = ["bright_swiss", "detailed"]
-        return {k: v for k, v in all_templates.items() if k in allowed}
+        templates = {k: v for k, v in all_templates.items() if k in ALLOWED_TEMPLATES}
+        # Inverse lookup for the UI, which works with display names
+        self._name_to_id = {info["name"]: tid for tid, info in templates.items()}
+        return templates
     
     def _setup_ui(self) -> None:
         """Set up the user interface."""
+        # Shared Font objects: Tk parses a font tuple into a font object on
+        # every widget creation, so the input rows reuse these two instead
+        self._font_label = tkfont.Font(family="Arial", size=12)
+        self._font_entry = tkfont.Font(family="Arial", size=12)
+
         # Main container
         main_frame = ttk.Frame(self.root, padding="20")
         main_frame.grid(row=0, column=0, sticky="nsew")
@@ -105,37 +179,39 @@ class CardGameGeneratorGUI:
         title = ttk.Label(parent, text="Card Game Generator", font=FONT_TITLE)
         title.grid(row=0, column=0, columnspan=3, pady=(0, 20))
     
+    def _row_label(self, parent: ttk.Frame, row: int, text: str) -> None:
+        """Place a left-column label for an input row."""
+        ttk.Label(parent, text=text, font=self._font_label).grid(
+            row=row, column=0, sticky="w", pady=5
+        )
+
     def _create_inputs(self, parent: ttk.Frame) -> None:
         """Create the input fields."""
         row = 1
-        
+
         # Theme input
-        ttk.Label(parent, text="Theme:", font=FONT_LABEL).grid(
-            row=row, column=0, sticky="w", pady=5
+        self._row_label(parent, row, "Theme:")
+        theme_entry = ttk.Entry(
+            parent, textvariable=self.theme_var, font=self._font_entry, width=30
         )
-        theme_entry = ttk.Entry(parent, textvariable=self.theme_var, font=FONT_ENTRY, width=30)
         theme_entry.grid(row=row, column=1, sticky="ew", pady=5, padx=(10, 0))
         row += 1
-        
+
         # Number of cards
-        ttk.Label(parent, text="Number of Cards:", font=FONT_LABEL).grid(
-            row=row, column=0, sticky="w", pady=5
-        )
+        self._row_label(parent, row, "Number of Cards:")
         num_spinbox = ttk.Spinbox(
             parent,
             from_=MIN_CARDS,
             to=MAX_CARDS,
             textvariable=self.num_cards_var,
-            font=FONT_ENTRY,
+            font=self._font_entry,
             width=10
         )
         num_spinbox.grid(row=row, column=1, sticky="w", pady=5, padx=(10, 0))
         row += 1
-        
+
         # Template selection
-        ttk.Label(parent, text="Card Template:", font=FONT_LABEL).grid(
-            row=row, column=0, sticky="w", pady=5
-        )
+        self._row_label(parent, row, "Card Template:")
         template_frame = ttk.Frame(parent)
         template_frame.grid(row=row, column=1, sticky="ew", pady=5, padx=(10, 0))
         template_frame.columnconfigure(0, weight=1)
@@ -146,7 +222,7 @@ class CardGameGeneratorGUI:
             textvariable=self.template_var,
             values=template_names,
             state="readonly",
-            font=FONT_ENTRY
+            font=self._font_entry
         )
         self.template_combo.grid(row=0, column=0, sticky="ew", padx=(0, 5))
         
@@ -161,9 +237,7 @@ class CardGameGeneratorGUI:
         row += 1
         
         # Output directory
-        ttk.Label(parent, text="Output Directory:", font=FONT_LABEL).grid(
-            row=row, column=0, sticky="w", pady=5
-        )
+        self._row_label(parent, row, "Output Directory:")
         output_frame = ttk.Frame(parent)
         output_frame.grid(row=row, column=1, sticky="ew", pady=5, padx=(10, 0))
         output_frame.columnconfigure(0, weight=1)
@@ -175,13 +249,24 @@ class CardGameGeneratorGUI:
         browse_btn.grid(row=0, column=1)
         row += 1
         
-        # Generate button
+        # Generate / Cancel buttons
+        button_frame = ttk.Frame(parent)
+        button_frame.grid(row=row, column=0, columnspan=2, pady=20)
+
         self.generate_button = ttk.Button(
-            parent,
+            button_frame,
             text="Generate Card Game",
             command=self._generate_cards
         )
-        self.generate_button.grid(row=row, column=0, columnspan=2, pady=20)
+        self.generate_button.grid(row=0, column=0, padx=(0, 5))
+
+        self.cancel_button = ttk.Button(
+            button_frame,
+            text="Cancel",
+            command=self._cancel_generation,
+            state='disabled'
+        )
+        self.cancel_button.grid(row=0, column=1)
     
     def _create_progress_section(self, parent: ttk.Frame) -> None:
         """Create the progress bar and status label."""
@@ -208,7 +293,20 @@ class CardGameGeneratorGUI:
         text_frame.rowconfigure(0, weight=1)
         parent.rowconfigure(9, weight=1)
         
-        self.log_text = tk.Text(text_frame, height=8, width=60, font=FONT_LOG)
+        # Read-only log view; _flush_log toggles the state around inserts.
+        # Undo bookkeeping and line wrapping are both per-insert costs the
+        # append-only log doesn't need, so they're switched off.
+        self.log_text = tk.Text(
+            text_frame,
+            height=8,
+            width=60,
+            font=FONT_LOG,
+            state="disabled",
+            undo=False,
+            autoseparators=False,
+            maxundo=0,
+            wrap="none"
+        )
         scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.log_text.yview)
         self.log_text.configure(yscrollcommand=scrollbar.set)
         
@@ -220,12 +318,13 @@ class CardGameGeneratorGUI:
         examples_frame = ttk.LabelFrame(parent, text="Example Themes", padding="10")
         examples_frame.grid(row=10, column=0, columnspan=2, sticky="ew", pady=(10, 0))
         
-        for i, theme in enumerate(EXAMPLE_THEMES):
-            btn = ttk.Button(
-                examples_frame,
-                text=theme,
-                command=lambda t=theme: self.theme_var.set(t)
-            )
+        # Plain tk.Button skips the ttk style engine for these simple
+        # theme-setter buttons, and partial avoids a closure per button
+        self._theme_buttons = [
+            tk.Button(examples_frame, text=theme, command=partial(self.theme_var.set, theme))
+            for theme in EXAMPLE_THEMES
+        ]
+        for i, btn in enumerate(self._theme_buttons):
             btn.grid(row=i // 4, column=i % 4, padx=5, pady=2, sticky="w")
     
     # =========================================================================
@@ -235,45 +334,26 @@ class CardGameGeneratorGUI:
     def _show_template_info(self) -> None:
         """Display information about the selected template."""
         selected_name = self.template_var.get()
-        if not selected_name:
+        template_id = self._name_to_id.get(selected_name)
+        if template_id is None:
             return
-        
-        for template_id, info in self.templates.items():
-            if info["name"] == selected_name:
-                features = self._get_template_features(template_id)
-                message = (
-                    f"Template: {info['name']}\n\n"
-                    f"Description: {info['description']}\n\n"
-                    f"Features:\n{features}"
-                )
-                messagebox.showinfo("Template Information", message)
-                return
+
+        info = self.templates[template_id]
+        features = self._get_template_features(template_id)
+        message = (
+            f"Template: {info['name']}\n\n"
+            f"Description: {info['description']}\n\n"
+            f"Features:\n{features}"
+        )
+        messagebox.showinfo("Template Information", message)
     
     def _get_template_features(self, template_id: str) -> str:
         """Get feature list for a template."""
-        features = {
-            "bright_swiss": (
-                "• Bright yellow and blue color scheme\n"
-                "• Bold, modern typography\n"
-                "• Distinct header and footer sections\n"
-                "• Image with luminosity blend mode"
-            ),
-            "detailed": (
-                "• Ornate, detailed frame design\n"
-                "• Textured background elements\n"
-                "• Prominent name bar\n"
-                "• Integrated stats and description area"
-            ),
-        }
-        return features.get(template_id, "No features available.")
+        return _TEMPLATE_FEATURES.get(template_id, "No features available.")
     
     def _get_selected_template_id(self) -> str:
         """Get the ID of the currently selected template."""
-        selected_name = self.template_var.get()
-        for template_id, info in self.templates.items():
-            if info["name"] == selected_name:
-                return template_id
-        return "bright_swiss"
+        return self._name_to_id.get(self.template_var.get(), "bright_swiss")
     
     def _browse_output_dir(self) -> None:
         """Open a directory browser dialog."""
@@ -282,17 +362,66 @@ class CardGameGeneratorGUI:
             self.output_dir_var.set(directory)
     
     def _log_message(self, message: str) -> None:
-        """Add a message to the log area."""
-        self.log_text.insert(tk.END, message + "\n")
+        """Queue a message for the log area; flushed in batches."""
+        self._log_queue.append(message + "\n")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(UI_FLUSH_INTERVAL_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Drain queued log lines into the Text widget in one insert."""
+        self._flush_scheduled = False
+        if not self._log_queue:
+            return
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        # The widget is kept disabled (read-only) between flushes; enabling
+        # only around the single batched insert defers redraw work to one
+        # pass per flush
+        self.log_text.configure(state="normal")
+        self.log_text.insert(tk.END, "".join(lines))
+        # Cap the buffer so very long sessions don't accumulate memory
+        if int(self.log_text.index("end-1c").split(".")[0]) > LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"end-{LOG_KEEP_LINES}l")
+        self.log_text.configure(state="disabled")
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
-    
+
+    def _pump_ui_queue(self) -> None:
+        """Apply queued worker messages to the widgets (main thread only)."""
+        try:
+            for _ in range(UI_PUMP_BATCH_SIZE):
+                kind, *args = self._ui_queue.get_nowait()
+                if kind == "log":
+                    self._log_message(args[0])
+                elif kind == "progress":
+                    percent, status, log_line, is_final = args
+                    now = time.monotonic()
+                    if is_final or now - self._last_progress_redraw >= PROGRESS_REDRAW_INTERVAL:
+                        self._last_progress_redraw = now
+                        self.progress_var.set(percent)
+                        self.status_var.set(status)
+                    self._log_message(log_line)
+                elif kind == "messagebox":
+                    show, title, text = args
+                    show(title, text)
+                elif kind == "generation_done":
+                    self._enable_generate_button()
+        except queue.Empty:
+            pass
+        self.root.after(UI_PUMP_INTERVAL_MS, self._pump_ui_queue)
+
+    def _log_from_worker(self, message: str) -> None:
+        """Post a log line from a background thread."""
+        self._ui_queue.put(("log", message))
+
     def _progress_callback(self, message: str, current: int, total: int) -> None:
-        """Handle progress updates from the generator."""
+        """Handle progress updates from the generator (worker thread)."""
         progress_percent = (current / total) * 100 if total > 0 else 0
-        self.progress_var.set(progress_percent)
-        self.status_var.set(message)
-        self._log_message(f"[{current}/{total}] {message}")
+        self._ui_queue.put(
+            ("progress", progress_percent, message,
+             f"[{current}/{total}] {message}", current >= total)
+        )
     
     def _generate_cards(self) -> None:
         """Validate inputs and start card generation."""
@@ -303,27 +432,30 @@ class CardGameGeneratorGUI:
         
         try:
             num_cards = int(self.num_cards_var.get())
-            if not MIN_CARDS <= num_cards <= MAX_CARDS:
-                messagebox.showerror("Error", f"Number of cards must be between {MIN_CARDS} and {MAX_CARDS}!")
-                return
         except ValueError:
-            messagebox.showerror("Error", "Please enter a valid number of cards!")
+            messagebox.showerror("Error", _ERR_NUM_INVALID)
+            return
+        if num_cards not in _ALLOWED_CARD_RANGE:
+            messagebox.showerror("Error", _ERR_NUM_RANGE)
             return
         
         output_dir = self.output_dir_var.get()
-        if not os.path.exists(output_dir):
-            try:
-                os.makedirs(output_dir)
-            except OSError as e:
-                messagebox.showerror("Error", f"Could not create output directory: {e}")
-                return
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            messagebox.showerror("Error", f"Could not create output directory: {e}")
+            return
         
         template_id = self._get_selected_template_id()
-        
+
         # Prepare UI for generation
         self.generate_button.config(state='disabled')
+        self.cancel_button.config(state='normal')
+        self._cancel_event.clear()
         self.progress_var.set(0)
+        self.log_text.configure(state="normal")
         self.log_text.delete(1.0, tk.END)
+        self.log_text.configure(state="disabled")
         
         # Start generation thread
         thread = threading.Thread(
@@ -333,6 +465,18 @@ class CardGameGeneratorGUI:
         )
         thread.start()
     
+    def _cancel_generation(self) -> None:
+        """Request cancellation of the running generation."""
+        if not self._cancel_event.is_set():
+            self._cancel_event.set()
+            self.cancel_button.config(state='disabled')
+            self._log_message("Cancellation requested; finishing current cards...")
+
+    def _enable_generate_button(self) -> None:
+        """Re-enable the generate button (main thread)."""
+        self.generate_button.config(state='normal')
+        self.cancel_button.config(state='disabled')
+
     def _generation_thread(
         self,
         theme: str,
@@ -341,41 +485,54 @@ class CardGameGeneratorGUI:
         template_id: str
     ) -> None:
         """Background thread for card generation."""
+        from card_generator import create_card_game_zip
+
         try:
             template_name = self.templates[template_id]["name"]
             
-            self._log_message(f"Starting generation of {num_cards} cards for theme: {theme}")
-            self._log_message(f"Template: {template_name}")
-            self._log_message(f"Output directory: {output_dir}")
-            self._log_message("-" * 50)
+            self._log_from_worker(f"Starting generation of {num_cards} cards for theme: {theme}")
+            self._log_from_worker(f"Template: {template_name}")
+            self._log_from_worker(f"Output directory: {output_dir}")
+            self._log_from_worker("-" * 50)
             
             zip_file = create_card_game_zip(
                 theme,
                 output_dir,
                 num_cards,
                 template_id,
-                self._progress_callback
+                self._progress_callback,
+                cancel_event=self._cancel_event
             )
-            
-            self._log_message("-" * 50)
-            self._log_message(f"SUCCESS! Card game generated: {zip_file}")
-            
-            # Show success message on main thread
-            self.root.after(0, lambda: messagebox.showinfo(
-                "Success",
-                f"Card game generated successfully!\n\n"
-                f"Template: {template_name}\n"
-                f"File: {os.path.basename(zip_file)}\n"
-                f"Location: {os.path.dirname(zip_file)}"
-            ))
-            
+
+            self._log_from_worker("-" * 50)
+            if self._cancel_event.is_set():
+                self._log_from_worker(f"Generation cancelled. Partial game saved: {zip_file}")
+                done_text = (
+                    f"Generation was cancelled.\n\n"
+                    f"Cards finished before cancelling were kept in:\n"
+                    f"{zip_file}"
+                )
+                self._ui_queue.put(("messagebox", messagebox.showinfo, "Cancelled", done_text))
+            else:
+                self._log_from_worker(f"SUCCESS! Card game generated: {zip_file}")
+
+                # All string assembly (including the path splitting) happens
+                # here on the worker; the pump only pops the dialog
+                success_text = (
+                    f"Card game generated successfully!\n\n"
+                    f"Template: {template_name}\n"
+                    f"File: {os.path.basename(zip_file)}\n"
+                    f"Location: {os.path.dirname(zip_file)}"
+                )
+                self._ui_queue.put(("messagebox", messagebox.showinfo, "Success", success_text))
+
         except Exception as e:
             error_msg = f"Error generating cards: {e}"
-            self._log_message(error_msg)
-            self.root.after(0, lambda: messagebox.showerror("Error", error_msg))
-        
+            self._log_from_worker(error_msg)
+            self._ui_queue.put(("messagebox", messagebox.showerror, "Error", error_msg))
+
         finally:
-            self.root.after(0, lambda: self.generate_button.config(state='normal'))
+            self._ui_queue.put(("generation_done",))
 
 
 # =============================================================================
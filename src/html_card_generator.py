@@ -6,10 +6,37 @@ using HTML/CSS templates and the wkhtmltoimage utility.
 """
 
 import base64
+import bisect
+import functools
+import hashlib
 import os
+import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Optional, Protocol
+
+# Optional SIMD-accelerated base64 (AVX2/AVX-512); falls back to the stdlib's
+# scalar encoder when not installed
+try:
+    import pybase64 as _pybase64
+except ImportError:
+    _pybase64 = None
+
+_b64encode = _pybase64.b64encode if _pybase64 is not None else base64.b64encode
+
+# Optional multi-GB/s hash for render-skip keys; hashlib's blake2b is the
+# fallback and fast enough next to a wkhtmltoimage startup
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+# Optional vectorized math for batch stat totals
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
 
 
 # =============================================================================
@@ -32,6 +59,10 @@ CARD_WIDTH = 428
 CARD_HEIGHT = 571
 ASSETS_DIR = Path(__file__).parent.parent / "assets"
 
+# Opt-in in-process compositor (see pillow_card_renderer); the HTML
+# renderer stays the default because it is pixel-faithful to the templates
+USE_PILLOW_RENDERER = os.environ.get('CARD_RENDERER', '').lower() == 'pillow'
+
 # Template definitions
 TEMPLATES = {
     "bright_swiss": {
@@ -51,115 +82,412 @@ TEMPLATES = {
 # Helper Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=16)
+def _read_template(template_path: str, mtime_ns: int) -> str:
+    """Read a template file; cached per (path, mtime) version."""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_template(
+    template_path: str, mtime_ns: int
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Split a template into literal segments and placeholder names.
+
+    Parsing happens once per template version; rendering then interleaves
+    the card's values between the literals with a single join and never
+    scans the document at all.
+
+    Returns:
+        (literals, names) where literals has exactly one more entry than
+        names and the original text is literals interleaved with the
+        {{name}} markers.
+    """
+    parts = _PLACEHOLDER_RE.split(_read_template(template_path, mtime_ns))
+    return tuple(parts[0::2]), tuple(parts[1::2])
+
+
+def _load_compiled_template(
+    template_path: str,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Load a template in precompiled (literals, names) form."""
+    return _compile_template(template_path, os.stat(template_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _asset_data_uri(path: str, mime: str = "image/png") -> str:
+    """
+    Encode a shared asset file to a base64 data URI, cached per path.
+
+    Assets under assets/ (fallback art, the template test image) are embedded
+    unchanged into every card that uses them; caching the encoding turns N
+    identical read-and-encode passes into one.
+
+    Args:
+        path: Path to the asset file
+        mime: MIME type recorded in the data URI
+
+    Returns:
+        A base64 data URI string.
+    """
+    with open(path, 'rb') as f:
+        return f"data:{mime};base64,{_b64encode(f.read()).decode('ascii')}"
+
+
+# wkhtmltoimage options are all derived from constants, so the argument
+# list is built once at import instead of per render
+_WKHTML_OPTIONS = (
+    '--enable-local-file-access',
+    '--width', str(CARD_WIDTH),
+    '--height', str(CARD_HEIGHT),
+    '--quality', '100',
+    '--format', 'png',
+    '--disable-smart-width',
+    '--crop-h', str(CARD_HEIGHT),
+    '--crop-w', str(CARD_WIDTH),
+    '--crop-x', '0',
+    '--crop-y', '0',
+)
+_WKHTML_PREFIX = ['wkhtmltoimage', *_WKHTML_OPTIONS]
+_WKHTML_OPTIONS_LINE = ' '.join(_WKHTML_OPTIONS)
+
+# Matches {{PLACEHOLDER_NAME}} markers in the HTML templates
+_PLACEHOLDER_RE = re.compile(r'\{\{([A-Z_]+)\}\}')
+
+
+def _template_id_for_path(template_path: str) -> Optional[str]:
+    """Map a template file path back to its id, for renderer routing."""
+    filename = Path(template_path).name
+    for template_id, info in TEMPLATES.items():
+        if info["filename"] == filename:
+            return template_id
+    return None
+
+
+def _content_key(html_bytes: bytes) -> str:
+    """
+    Hash a rendered HTML document into a render-skip key.
+
+    The populated HTML already folds in the template, the embedded card
+    art, and every card field, so hashing it covers all render inputs in
+    one pass with no separate canonical serialization step. 128 bits of
+    digest is plenty for a cache key and halves the sidecar/compare size.
+    """
+    if _blake3 is not None:
+        return _blake3.blake3(html_bytes).hexdigest(length=16)
+    return hashlib.blake2b(html_bytes, digest_size=16).hexdigest()
+
+
+def _is_output_current(output_path: str, key: str) -> bool:
+    """Check whether output_path exists and its sidecar hash matches key."""
+    if not os.path.exists(output_path):
+        return False
+    try:
+        with open(output_path + '.hash', 'r', encoding='ascii') as f:
+            return f.read() == key
+    except OSError:
+        return False
+
+
+def _write_output_hash(output_path: str, key: str) -> None:
+    """Record the render key for output_path in its sidecar file."""
+    with open(output_path + '.hash', 'w', encoding='ascii') as f:
+        f.write(key)
+
+# Streaming encode chunk size; a multiple of 3 so each chunk encodes
+# independently with no base64 carry between chunks
+_B64_CHUNK = 48 * 1024
+
+_DATA_URL_PREFIX = b"data:image/png;base64,"
+
+
+@functools.lru_cache(maxsize=128)
+def _card_art_data_url(path: str, mtime_ns: int, size: int) -> str:
+    """
+    Encode card artwork to a base64 data URL, cached per file version.
+
+    Keyed on (path, mtime, size) so a re-generated image at the same path
+    is re-encoded, while unchanged art reused across card variants (or
+    across templates in the test run) is encoded once.
+
+    The file streams through the encoder in 48 KiB chunks written into a
+    preallocated buffer, so peak memory is one chunk plus the output
+    instead of the whole file plus its 4/3-sized encoding.
+    """
+    out = bytearray(len(_DATA_URL_PREFIX) + (size + 2) // 3 * 4)
+    out[:len(_DATA_URL_PREFIX)] = _DATA_URL_PREFIX
+    pos = len(_DATA_URL_PREFIX)
+    with open(path, 'rb') as img_file:
+        while chunk := img_file.read(_B64_CHUNK):
+            encoded = _b64encode(chunk)
+            out[pos:pos + len(encoded)] = encoded
+            pos += len(encoded)
+    # The file may have changed size between stat and read
+    del out[pos:]
+    return out.decode('ascii')
+
+
 def _encode_image_to_base64(image_path: str) -> str:
     """
     Encode an image file to a base64 data URL.
-    
+
     Args:
         image_path: Path to the image file
-    
+
     Returns:
         A base64 data URL string, or a placeholder URL if the file doesn't exist.
     """
-    if os.path.exists(image_path):
-        with open(image_path, 'rb') as img_file:
-            img_data = base64.b64encode(img_file.read()).decode('utf-8')
-            return f"data:image/png;base64,{img_data}"
-    
-    print(f"Warning: Card image not found at {image_path}. Using placeholder.")
-    return "https://placehold.co/428x350/000/FFF?text=Image+Not+Found"
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        print(f"Warning: Card image not found at {image_path}. Using placeholder.")
+        return "https://placehold.co/428x350/000/FFF?text=Image+Not+Found"
+
+    # Shared assets live for the whole process; per-card artwork goes
+    # through a bounded, stat-keyed cache so repeated art is encoded once
+    # but stale entries fall out once the file changes.
+    path = Path(image_path).resolve()
+    if path.is_relative_to(ASSETS_DIR.resolve()):
+        mime = "image/jpeg" if path.suffix.lower() in ('.jpg', '.jpeg') else "image/png"
+        return _asset_data_uri(str(path), mime)
+
+    return _card_art_data_url(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+# Markup emitted per stat; kept whitespace-free since the output only
+# feeds the renderer
+_STAT_TMPL = (
+    '<div class="stat-item">'
+    '<div class="stat-label">{name}</div>'
+    '<div class="stat-value">{value}</div>'
+    '</div>'
+)
 
 
 def _generate_stats_html(stats: dict[str, int]) -> str:
     """
     Generate HTML markup for card statistics.
-    
+
     Args:
         stats: Dictionary of stat names to values
-    
+
     Returns:
         HTML string representing the stats.
     """
     if not stats:
         return "No Stats Available"
-    
-    html_parts = []
-    for stat_name, stat_value in stats.items():
-        html_parts.append(f'''
-            <div class="stat-item">
-                <div class="stat-label">{stat_name.upper()}</div>
-                <div class="stat-value">{stat_value}</div>
-            </div>
-        ''')
-    
-    return ''.join(html_parts)
+
+    return ''.join(
+        _STAT_TMPL.format(name=name.upper(), value=value)
+        for name, value in stats.items()
+    )
+
+
+# Rarity tiers: totals of (10, 15] are Rare, (15, 20] Epic, >20 Legendary
+_RARITY_THRESHOLDS = (10, 15, 20)
+_RARITIES = ('Common', 'Rare', 'Epic', 'Legendary')
 
 
 def _determine_rarity(stats: dict[str, int]) -> str:
     """
     Determine card rarity based on total stat values.
-    
+
     Args:
         stats: Dictionary of stat names to values
-    
+
     Returns:
         Rarity string: "Legendary", "Epic", "Rare", or "Common"
     """
     total = sum(stats.values()) if stats else 0
-    
-    if total > 20:
-        return "Legendary"
-    elif total > 15:
-        return "Epic"
-    elif total > 10:
-        return "Rare"
-    return "Common"
+    return _RARITIES[bisect.bisect_left(_RARITY_THRESHOLDS, total)]
 
 
-def _run_wkhtmltoimage(html_path: str, output_path: str) -> bool:
+def _determine_rarities_batch(stats_list: list[dict[str, int]]) -> list[str]:
     """
-    Convert an HTML file to an image using wkhtmltoimage.
-    
+    Determine rarities for a batch of cards at once.
+
+    When numpy is installed and every card carries the same number of
+    all-integer stats, the dict-per-card layout collapses into an (N, K)
+    matrix and the totals plus tier bins compute in two vectorized
+    operations. Otherwise — ragged stats, non-integer values, or no
+    numpy — it falls back to the per-card lookup, with identical results
+    either way. The int check matters: an int64 cast would silently
+    truncate float values the scalar path sums exactly.
+
+    Args:
+        stats_list: One stats dictionary per card
+
+    Returns:
+        One rarity string per card, in input order.
+    """
+    if _np is not None and stats_list:
+        lengths = {len(stats) for stats in stats_list}
+        if len(lengths) == 1 and lengths != {0}:
+            rows = [list(stats.values()) for stats in stats_list]
+            if all(isinstance(value, int) for row in rows for value in row):
+                matrix = _np.array(rows, dtype=_np.int64)
+                bins = _np.searchsorted(
+                    _RARITY_THRESHOLDS, matrix.sum(axis=1), side='left'
+                )
+                return [_RARITIES[i] for i in bins]
+    return [_determine_rarity(stats) for stats in stats_list]
+
+
+def _run_wkhtmltoimage(html_bytes: bytes, output_path: str) -> bool:
+    """
+    Convert an HTML document to an image using wkhtmltoimage.
+
+    The document is piped to the process over stdin ('-' input), so no
+    temporary HTML file touches the disk; card images arrive embedded as
+    base64 data URLs, so the renderer needs no file access anyway. The
+    PNG is rendered to a .part file and moved into place with os.replace,
+    so other readers (and the hash sidecar) only ever see complete images.
+
     Args:
-        html_path: Path to the HTML file to convert
+        html_bytes: UTF-8 encoded HTML document to convert
         output_path: Path where the output image should be saved
-    
+
     Returns:
         True if conversion was successful, False otherwise.
     """
-    cmd = [
-        'wkhtmltoimage',
-        '--enable-local-file-access',
-        '--width', str(CARD_WIDTH),
-        '--height', str(CARD_HEIGHT),
-        '--quality', '100',
-        '--format', 'png',
-        '--disable-smart-width',
-        '--crop-h', str(CARD_HEIGHT),
-        '--crop-w', str(CARD_WIDTH),
-        '--crop-x', '0',
-        '--crop-y', '0',
-        html_path,
-        output_path
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
+    part_path = output_path + '.part'
+    cmd = _WKHTML_PREFIX + ['-', part_path]
+
+    # stdout is noise on success; only stderr is kept, and it is decoded
+    # only when the render actually failed
+    result = subprocess.run(
+        cmd, input=html_bytes, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
     if result.returncode != 0:
-        print(f"Error converting HTML to image: {result.stderr}")
+        print(f"Error converting HTML to image: {result.stderr.decode('utf-8', 'replace')}")
+        try:
+            os.unlink(part_path)
+        except OSError:
+            pass
         return False
-    
+
+    os.replace(part_path, output_path)
     return True
 
 
+def _run_wkhtmltoimage_batch(jobs: list[tuple[str, str]]) -> list[bool]:
+    """
+    Convert several HTML files to images with one wkhtmltoimage process.
+
+    wkhtmltoimage pays its Qt startup cost (a few hundred ms) on every
+    invocation, which dominates a single card render. --read-args-from-stdin
+    lets one process perform every conversion in sequence, so a batch pays
+    that startup once instead of once per card.
+
+    Args:
+        jobs: List of (html_path, output_path) pairs to convert
+
+    Returns:
+        Per-job success flags, in the same order as jobs.
+    """
+    if not jobs:
+        return []
+
+    # Each job renders to a .part file that is moved into place afterwards,
+    # so concurrent batches and readers only ever see complete images
+    arg_lines = ''.join(
+        f'{_WKHTML_OPTIONS_LINE} "{html_path}" "{output_path}.part"\n'
+        for html_path, output_path in jobs
+    )
+
+    try:
+        result = subprocess.run(
+            ['wkhtmltoimage', '--read-args-from-stdin'],
+            input=arg_lines.encode('utf-8'),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+    except OSError as e:
+        # Same degradation as the single-card path when the binary is
+        # missing or unrunnable: report and fail the jobs, don't raise
+        print(f"Error converting HTML to image: {e}")
+        return [False] * len(jobs)
+
+    # A failed conversion doesn't abort the remaining lines, so judge each
+    # job by whether its output materialized rather than by the exit code.
+    successes = []
+    for _, output_path in jobs:
+        try:
+            os.replace(output_path + '.part', output_path)
+            successes.append(True)
+        except OSError:
+            successes.append(False)
+    if not all(successes):
+        print(f"Error converting HTML to image: {result.stderr.decode('utf-8', 'replace')}")
+    return successes
+
+
+def _build_card_html(
+    card: CardProtocol,
+    card_image_path: str,
+    template_path: str,
+    card_number: int,
+    rarity: Optional[str] = None
+) -> str:
+    """
+    Populate an HTML template with a card's data.
+
+    Args:
+        card: Card object with name, description, stats, and card_type
+        card_image_path: Path to the card's artwork image
+        template_path: Path to the HTML template file
+        card_number: Card number for display on the card
+        rarity: Precomputed rarity; derived from the stats when omitted
+
+    Returns:
+        The populated HTML document as a string.
+    """
+    # Load the template in precompiled (literals, names) form
+    literals, names = _load_compiled_template(template_path)
+
+    # Prepare template data
+    img_src = _encode_image_to_base64(card_image_path)
+    stats_html = _generate_stats_html(card.stats)
+    if rarity is None:
+        rarity = _determine_rarity(card.stats)
+    description = card.description or ""
+
+    replacements = {
+        "CARD_NAME": card.name,
+        "CARD_TYPE": card.card_type.title(),
+        "CARD_IMAGE_URL": img_src,
+        "CARD_DESCRIPTION": description,
+        "CARD_STATS": stats_html,
+        "CARD_RARITY": rarity,
+        "CARD_NUMBER": f"{card_number:03d}",
+    }
+
+    # Interleave values between the precompiled literals; the document is
+    # never scanned at render time. Unknown placeholders pass through
+    # verbatim, as the replace chain this evolved from left them alone.
+    parts = [literals[0]]
+    for name, literal in zip(names, literals[1:]):
+        value = replacements.get(name)
+        parts.append(value if value is not None else '{{' + name + '}}')
+        parts.append(literal)
+    return ''.join(parts)
+
+
 # =============================================================================
 # Main Functions
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def get_available_templates() -> dict[str, dict[str, Any]]:
     """
     Get a dictionary of available card templates.
-    
+
+    The result is cached for the life of the process: discovery stats the
+    assets directory and the template set never changes at runtime.
+
     Returns:
         Dictionary mapping template IDs to template info dictionaries.
         Each template info contains: name, description, and path.
@@ -203,44 +531,31 @@ def create_html_card(
         True if the card was created successfully, False otherwise.
     """
     try:
-        # Read the HTML template
-        with open(template_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Prepare template data
-        img_src = _encode_image_to_base64(card_image_path)
-        stats_html = _generate_stats_html(card.stats)
-        rarity = _determine_rarity(card.stats)
-        description = card.description or ""
-        
-        # Replace placeholders
-        replacements = {
-            "{{CARD_NAME}}": card.name,
-            "{{CARD_TYPE}}": card.card_type.title(),
-            "{{CARD_IMAGE_URL}}": img_src,
-            "{{CARD_DESCRIPTION}}": description,
-            "{{CARD_STATS}}": stats_html,
-            "{{CARD_RARITY}}": rarity,
-            "{{CARD_NUMBER}}": f"{card_number:03d}",
-        }
-        
-        for placeholder, value in replacements.items():
-            html_content = html_content.replace(placeholder, value)
-        
-        # Save temporary HTML file
-        temp_html_path = output_path.replace('.png', '_temp.html')
-        with open(temp_html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Convert to image
-        success = _run_wkhtmltoimage(temp_html_path, output_path)
-        
-        # Clean up temporary file
-        if os.path.exists(temp_html_path):
-            os.remove(temp_html_path)
-        
+        if USE_PILLOW_RENDERER:
+            import pillow_card_renderer
+
+            template_id = _template_id_for_path(template_path)
+            if template_id is not None and pillow_card_renderer.supports(template_id):
+                return pillow_card_renderer.render_card(
+                    card, card_image_path, template_id, output_path, card_number
+                )
+
+        html_content = _build_card_html(card, card_image_path, template_path, card_number)
+        html_bytes = html_content.encode('utf-8')
+
+        # Skip the render entirely when the existing output was produced
+        # from byte-identical inputs; the hash is microseconds against the
+        # renderer's multi-hundred-ms startup
+        key = _content_key(html_bytes)
+        if _is_output_current(output_path, key):
+            return True
+
+        # Convert to image, piping the HTML straight to the renderer
+        success = _run_wkhtmltoimage(html_bytes, output_path)
+        if success:
+            _write_output_hash(output_path, key)
         return success
-        
+
     except FileNotFoundError as e:
         print(f"Template file not found: {e}")
         return False
@@ -249,6 +564,134 @@ def create_html_card(
         return False
 
 
+def render_cards_batch(
+    jobs: list[tuple[CardProtocol, str, str, str, int]]
+) -> list[bool]:
+    """
+    Render several cards with a single wkhtmltoimage process.
+
+    Each job mirrors create_html_card's arguments:
+    (card, card_image_path, template_path, output_path, card_number).
+    All HTML documents are prepared up front, converted in one
+    --read-args-from-stdin invocation, and the temporary files cleaned up
+    afterwards. A card whose HTML cannot be built is reported as failed
+    without affecting the rest of the batch.
+
+    Args:
+        jobs: List of render jobs, one tuple per card
+
+    Returns:
+        Per-job success flags, in the same order as jobs.
+    """
+    if USE_PILLOW_RENDERER:
+        # The compositor renders in-process in milliseconds, so there is
+        # no subprocess startup to amortize; jobs go through the
+        # single-card path, which also falls back to HTML when a template
+        # has no Pillow layout
+        return [create_html_card(*job) for job in jobs]
+
+    successes = [False] * len(jobs)
+    batch: list[tuple[str, str]] = []
+    batch_indices: list[int] = []
+    batch_keys: list[str] = []
+
+    # Rarities for the whole batch compute in one vectorized pass when
+    # numpy is available. Stats come from unvalidated LLM output; if any
+    # card's stats won't total, fall back to deriving rarity per job
+    # inside its try block, so a malformed card fails alone instead of
+    # poisoning the batch.
+    try:
+        rarities = _determine_rarities_batch([job[0].stats for job in jobs])
+    except Exception:
+        rarities = [None] * len(jobs)
+
+    for i, (card, card_image_path, template_path, output_path, card_number) in enumerate(jobs):
+        try:
+            html_content = _build_card_html(
+                card, card_image_path, template_path, card_number,
+                rarity=rarities[i]
+            )
+        except FileNotFoundError as e:
+            print(f"Template file not found: {e}")
+            continue
+        except Exception as e:
+            print(f"Error creating HTML card: {e}")
+            continue
+
+        # Up-to-date outputs don't join the batch at all
+        key = _content_key(html_content.encode('utf-8'))
+        if _is_output_current(output_path, key):
+            successes[i] = True
+            continue
+
+        temp_html_path = output_path.replace('.png', '_temp.html')
+        with open(temp_html_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        batch.append((temp_html_path, output_path))
+        batch_indices.append(i)
+        batch_keys.append(key)
+
+    try:
+        results = _run_wkhtmltoimage_batch(batch)
+        for i, key, (_, output_path), success in zip(
+            batch_indices, batch_keys, batch, results
+        ):
+            successes[i] = success
+            if success:
+                _write_output_hash(output_path, key)
+    finally:
+        # Unconditional unlink instead of exists-then-remove: one syscall,
+        # and no race window against a concurrent batch
+        for temp_html_path, _ in batch:
+            try:
+                os.unlink(temp_html_path)
+            except OSError:
+                pass
+
+    return successes
+
+
+def render_many(
+    jobs: list[tuple[CardProtocol, str, str, str, int]],
+    max_workers: Optional[int] = None
+) -> list[bool]:
+    """
+    Render cards in parallel across a bounded pool of batch processes.
+
+    The job list is split round-robin into one batch per worker and each
+    batch runs through render_cards_batch in its own thread, so the work
+    parallelizes across renderer processes while the pool stays bounded by
+    the CPU count — unbounded subprocess fan-out just trades render time
+    for swapping.
+
+    Args:
+        jobs: List of render jobs, one tuple per card (see render_cards_batch)
+        max_workers: Pool size cap; defaults to min(len(jobs), cpu count)
+
+    Returns:
+        Per-job success flags, in the same order as jobs.
+    """
+    if not jobs:
+        return []
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jobs)))
+
+    if max_workers == 1:
+        return render_cards_batch(jobs)
+
+    # jobs[i::w] puts job i into batch i % w, so batch sizes differ by at
+    # most one and every worker starts immediately
+    batches = [jobs[i::max_workers] for i in range(max_workers)]
+    results = [False] * len(jobs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for offset, batch_results in enumerate(executor.map(render_cards_batch, batches)):
+            for j, success in enumerate(batch_results):
+                results[offset + j * max_workers] = success
+    return results
+
+
 # =============================================================================
 # Test Function
 # =============================================================================
@@ -275,21 +718,22 @@ def test_html_card_generation() -> None:
     test_image = ASSETS_DIR / "card_template.jpg"
     output_dir = Path(__file__).parent.parent / "output"
     output_dir.mkdir(exist_ok=True)
-    
-    for template_id, template_info in templates.items():
+
+    # Batched and parallelized: the renderer's startup cost is paid once
+    # per worker, and independent renders overlap across cores
+    jobs = [
+        (test_card, str(test_image), info["path"],
+         str(output_dir / f"test_card_{template_id}.png"), 1)
+        for template_id, info in templates.items()
+    ]
+    results = render_many(jobs)
+
+    for (template_id, info), success in zip(templates.items(), results):
         output_path = output_dir / f"test_card_{template_id}.png"
-        
-        success = create_html_card(
-            test_card,
-            str(test_image),
-            template_info["path"],
-            str(output_path)
-        )
-        
         if success:
-            print(f"✓ Test card created: {template_info['name']} -> {output_path}")
+            print(f"✓ Test card created: {info['name']} -> {output_path}")
         else:
-            print(f"✗ Failed: {template_info['name']}")
+            print(f"✗ Failed: {info['name']}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,229 @@
+"""
+Pillow Card Renderer Module
+
+In-process compositor for the fixed-layout card templates. wkhtmltoimage
+spends hundreds of milliseconds on Qt startup to lay out what is, for these
+templates, a static arrangement of one image and a handful of text blocks;
+Pillow composites the same layout in roughly ten milliseconds without
+leaving the process.
+
+Opt-in: set the CARD_RENDERER environment variable to "pillow". Templates
+without a hand-authored layout here fall back to the HTML renderer.
+"""
+
+import functools
+import os
+import textwrap
+
+from PIL import Image, ImageDraw, ImageFont
+
+from html_card_generator import (
+    CARD_HEIGHT,
+    CARD_WIDTH,
+    CardProtocol,
+    _determine_rarity,
+)
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# Per-template palette, matched to the CSS variables of the HTML templates
+_STYLES = {
+    "bright_swiss": {
+        "background": "#f1faee",
+        "header": "#ffc300",
+        "panel": "#1d3557",
+        "text": "#1a1a1a",
+        "inverse_text": "#f1faee",
+        "number": "#e63946",
+    },
+    "detailed": {
+        "background": "#c1c1c1",
+        "header": "#9e9e9e",
+        "panel": "#7d7d7d",
+        "text": "#3a3a3a",
+        "inverse_text": "#f0f0f0",
+        "number": "#3a3a3a",
+    },
+}
+
+# Layout metrics shared by both templates (the templates differ in palette,
+# not geometry)
+_MARGIN = 16
+_HEADER_HEIGHT = 64
+_ART_TOP = 80
+_ART_HEIGHT = 300
+_TYPE_BAR_TOP = 396
+_TYPE_BAR_HEIGHT = 30
+_DESC_TOP = 438
+_STATS_TOP = 492
+_STATS_HEIGHT = 52
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _load_font(size: int, bold: bool = False) -> ImageFont.ImageFont:
+    """Load a truetype font at the given size, cached; falls back to
+    Pillow's built-in bitmap font when no system font is found."""
+    names = (
+        ("DejaVuSans-Bold.ttf", "arialbd.ttf")
+        if bold else
+        ("DejaVuSans.ttf", "arial.ttf")
+    )
+    for name in names:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default()
+
+
+def _paste_art(img: Image.Image, draw: ImageDraw.ImageDraw,
+               card_image_path: str, style: dict) -> None:
+    """Paste the card artwork into the art area, or draw a placeholder."""
+    box_width = CARD_WIDTH - 2 * _MARGIN
+    try:
+        with Image.open(card_image_path) as art:
+            art = art.convert("RGB").resize((box_width, _ART_HEIGHT))
+            img.paste(art, (_MARGIN, _ART_TOP))
+    except (OSError, ValueError):
+        draw.rectangle(
+            [_MARGIN, _ART_TOP, CARD_WIDTH - _MARGIN, _ART_TOP + _ART_HEIGHT],
+            fill="#d1d1d1"
+        )
+        draw.text(
+            (CARD_WIDTH // 2, _ART_TOP + _ART_HEIGHT // 2),
+            "Image Not Found",
+            font=_load_font(18),
+            fill=style["text"],
+            anchor="mm"
+        )
+
+
+def _draw_stats(draw: ImageDraw.ImageDraw, stats: dict[str, int], style: dict) -> None:
+    """Draw up to four stat boxes across the bottom of the card."""
+    shown = list(stats.items())[:4]
+    if not shown:
+        draw.text(
+            (CARD_WIDTH // 2, _STATS_TOP + _STATS_HEIGHT // 2),
+            "No Stats Available",
+            font=_load_font(14),
+            fill=style["text"],
+            anchor="mm"
+        )
+        return
+
+    gap = 8
+    box_width = (CARD_WIDTH - 2 * _MARGIN - gap * (len(shown) - 1)) // len(shown)
+    for i, (name, value) in enumerate(shown):
+        left = _MARGIN + i * (box_width + gap)
+        draw.rectangle(
+            [left, _STATS_TOP, left + box_width, _STATS_TOP + _STATS_HEIGHT],
+            fill=style["panel"]
+        )
+        center_x = left + box_width // 2
+        draw.text(
+            (center_x, _STATS_TOP + 13), name.upper(),
+            font=_load_font(12, bold=True), fill=style["inverse_text"], anchor="mm"
+        )
+        draw.text(
+            (center_x, _STATS_TOP + 35), str(value),
+            font=_load_font(20, bold=True), fill=style["inverse_text"], anchor="mm"
+        )
+
+
+# =============================================================================
+# Main Functions
+# =============================================================================
+
+def supports(template_id: str) -> bool:
+    """Check whether a hand-authored Pillow layout exists for a template."""
+    return template_id in _STYLES
+
+
+def render_card(
+    card: CardProtocol,
+    card_image_path: str,
+    template_id: str,
+    output_path: str,
+    card_number: int = 1
+) -> bool:
+    """
+    Composite a playable card image in-process with Pillow.
+
+    Follows the same layout as the HTML templates — header with the card
+    name, artwork, type/rarity bar, description, and a stats row — but
+    renders it with draw calls instead of a browser engine.
+
+    Args:
+        card: Card object with name, description, stats, and card_type
+        card_image_path: Path to the card's artwork image
+        template_id: Template whose palette to use (see supports())
+        output_path: Path where the final card image should be saved
+        card_number: Card number for display on the card
+
+    Returns:
+        True if the card was created successfully, False otherwise.
+    """
+    style = _STYLES.get(template_id)
+    if style is None:
+        return False
+
+    try:
+        img = Image.new("RGB", (CARD_WIDTH, CARD_HEIGHT), style["background"])
+        draw = ImageDraw.Draw(img)
+
+        # Header band with the card name
+        draw.rectangle([0, 0, CARD_WIDTH, _HEADER_HEIGHT], fill=style["header"])
+        draw.text(
+            (_MARGIN, _HEADER_HEIGHT // 2), card.name,
+            font=_load_font(26, bold=True), fill=style["text"], anchor="lm"
+        )
+
+        # Artwork
+        _paste_art(img, draw, card_image_path, style)
+
+        # Type / rarity bar
+        bar_bottom = _TYPE_BAR_TOP + _TYPE_BAR_HEIGHT
+        draw.rectangle([0, _TYPE_BAR_TOP, CARD_WIDTH, bar_bottom], fill=style["panel"])
+        bar_font = _load_font(15, bold=True)
+        bar_center = _TYPE_BAR_TOP + _TYPE_BAR_HEIGHT // 2
+        draw.text(
+            (_MARGIN, bar_center), card.card_type.title(),
+            font=bar_font, fill=style["inverse_text"], anchor="lm"
+        )
+        draw.text(
+            (CARD_WIDTH - _MARGIN, bar_center), _determine_rarity(card.stats),
+            font=bar_font, fill=style["inverse_text"], anchor="rm"
+        )
+
+        # Description, wrapped to the card width
+        desc_font = _load_font(14)
+        lines = textwrap.wrap(card.description or "", width=52)[:3]
+        for i, line in enumerate(lines):
+            draw.text(
+                (_MARGIN, _DESC_TOP + i * 17), line,
+                font=desc_font, fill=style["text"]
+            )
+
+        # Stats row and card number
+        _draw_stats(draw, card.stats, style)
+        draw.text(
+            (CARD_WIDTH - _MARGIN, CARD_HEIGHT - 6), f"{card_number:03d}",
+            font=_load_font(12, bold=True), fill=style["number"], anchor="rs"
+        )
+
+        # Same atomic-appear discipline as the HTML renderer
+        part_path = output_path + '.part'
+        img.save(part_path, format="PNG")
+        os.replace(part_path, output_path)
+        return True
+
+    except Exception as e:
+        print(f"Error compositing card with Pillow: {e}")
+        return False
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Card Game Generator - Installation Verification
+
+Checks that everything the application needs is in place: the Python
+version, required packages, the wkhtmltoimage system dependency, the
+bundled assets, a writable output directory, and connectivity to the
+generation APIs.
+
+Usage:
+    python verify_installation.py
+"""
+
+import importlib
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+
+# Distributions the application depends on, with the minimum versions
+# pinned in requirements.txt
+REQUIRED_PACKAGES = [
+    ("requests", "2.25.0"),
+    ("Pillow", "8.0.0"),
+]
+
+TEXT_API_MODELS_URL = "https://text.pollinations.ai/models"
+IMAGE_API_ROOT_URL = "https://image.pollinations.ai/"
+
+
+# When checks run concurrently, each worker collects its lines here and
+# the main thread prints them as one block, so check output never
+# interleaves and always appears in the same order
+_check_output = threading.local()
+
+
+def print_check(name: str, passed: bool, detail: str = "") -> bool:
+    """Print (or buffer) a single check result line and return the verdict."""
+    mark = "✓" if passed else "✗"
+    line = f"  {mark} {name}"
+    if detail:
+        line += f" ({detail})"
+    buffer = getattr(_check_output, "lines", None)
+    if buffer is not None:
+        buffer.append(line)
+    else:
+        print(line)
+    return passed
+
+
+def _run_buffered(check) -> tuple[bool, list[str]]:
+    """Run one check with its output buffered; returns (verdict, lines)."""
+    _check_output.lines = []
+    try:
+        result = check()
+    finally:
+        lines = _check_output.lines
+        _check_output.lines = None
+    return result, lines
+
+
+def check_python_version() -> bool:
+    """Check that the interpreter is Python 3.10 or newer."""
+    version = sys.version_info
+    return print_check(
+        "Python 3.10+",
+        version >= (3, 10),
+        f"found {version.major}.{version.minor}.{version.micro}"
+    )
+
+
+def check_tkinter() -> bool:
+    """Check that tkinter is importable (it ships with most Pythons)."""
+    try:
+        importlib.import_module("tkinter")
+        return print_check("tkinter", True)
+    except ImportError as e:
+        return print_check("tkinter", False, str(e))
+
+
+def _version_tuple(version_string: str) -> tuple[int, ...]:
+    """Turn the leading numeric components of a version into a tuple."""
+    parts = []
+    for part in version_string.split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+
+def check_required_packages() -> bool:
+    """Check that each required distribution is installed and new enough.
+
+    Reads installed-distribution metadata instead of importing the
+    packages, so the check never pays (or depends on) their import-time
+    side effects — notably PIL's plugin registration.
+    """
+    all_ok = True
+    for dist_name, min_version in REQUIRED_PACKAGES:
+        try:
+            found = version(dist_name)
+        except PackageNotFoundError:
+            all_ok &= print_check(
+                dist_name, False, "not installed - pip install -r requirements.txt"
+            )
+            continue
+        all_ok &= print_check(
+            dist_name,
+            _version_tuple(found) >= _version_tuple(min_version),
+            f"version {found}, need >= {min_version}"
+        )
+    return all_ok
+
+
+def check_wkhtmltoimage() -> bool:
+    """Check that the wkhtmltoimage binary is on PATH and runs."""
+    path = shutil.which("wkhtmltoimage")
+    if path is None:
+        return print_check(
+            "wkhtmltoimage", False, "not on PATH - install wkhtmltopdf"
+        )
+    try:
+        result = subprocess.run(
+            ["wkhtmltoimage", "--version"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
+        detail = result.stdout.decode("utf-8", "replace").strip() or path
+        return print_check("wkhtmltoimage", result.returncode == 0, detail)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return print_check("wkhtmltoimage", False, str(e))
+
+
+def check_assets() -> bool:
+    """Check that the bundled card templates are present."""
+    assets_dir = PROJECT_ROOT / "assets"
+    if not assets_dir.is_dir():
+        return print_check("assets directory", False, str(assets_dir))
+    templates = sorted(assets_dir.glob("*.html"))
+    return print_check(
+        "card templates", bool(templates), f"{len(templates)} found"
+    )
+
+
+def check_output_writable() -> bool:
+    """Check that the default output directory can be created and written."""
+    output_dir = PROJECT_ROOT / "output"
+    probe = output_dir / ".verify_write_test"
+    try:
+        output_dir.mkdir(exist_ok=True)
+        probe.write_text("ok")
+        probe.unlink()
+        return print_check("output directory writable", True, str(output_dir))
+    except OSError as e:
+        return print_check("output directory writable", False, str(e))
+
+
+def check_internet_connectivity() -> bool:
+    """Check that both generation APIs are reachable."""
+    try:
+        import requests
+    except ImportError:
+        return print_check("API connectivity", False, "requests not installed")
+
+    # One session so the second request reuses the TCP/TLS connection
+    # instead of paying a second handshake
+    with requests.Session() as session:
+        try:
+            text_response = session.get(TEXT_API_MODELS_URL, timeout=10)
+            text_ok = print_check(
+                "text API reachable", text_response.ok,
+                f"HTTP {text_response.status_code}"
+            )
+        except requests.exceptions.RequestException as e:
+            text_ok = print_check("text API reachable", False, str(e))
+
+        try:
+            # A HEAD against the service root answers "is it up" without
+            # asking the server to actually generate an image, which a GET
+            # on a prompt URL would — that can take many seconds of
+            # server-side diffusion for a liveness check
+            image_response = session.head(
+                IMAGE_API_ROOT_URL, timeout=5, allow_redirects=True
+            )
+            image_ok = print_check(
+                "image API reachable", image_response.status_code < 400,
+                f"HTTP {image_response.status_code}"
+            )
+        except requests.exceptions.RequestException as e:
+            image_ok = print_check("image API reachable", False, str(e))
+
+    return text_ok and image_ok
+
+
+def run_verification() -> bool:
+    """Run every check and print a summary; returns overall success."""
+    print("=" * 50)
+    print("  Card Game Generator - Installation Check")
+    print("=" * 50)
+    print()
+
+    checks = [
+        check_python_version,
+        check_tkinter,
+        check_required_packages,
+        check_wkhtmltoimage,
+        check_assets,
+        check_output_writable,
+        check_internet_connectivity,
+    ]
+
+    # The checks are independent and the network probes dominate wall
+    # time, so they all run concurrently; wall time collapses from the
+    # sum of the checks to the slowest one
+    results = []
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        for future in [executor.submit(_run_buffered, check) for check in checks]:
+            result, lines = future.result()
+            results.append(result)
+            for line in lines:
+                print(line)
+
+    print()
+    if all(results):
+        print("All checks passed - you're ready to run: python main.py")
+    else:
+        print("Some checks failed; see the lines marked ✗ above.")
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_verification() else 1)